@@ -1,5 +1,9 @@
 """Run the program."""
 
+import os
+import time
+from pathlib import Path
+
 import pygame as pg
 
 import my_game.initialise_pygame  # noqa: F401
@@ -9,6 +13,9 @@ from my_game.utils.state_manager import State, StateManager
 
 ORIGINAL_CAPTION = "My Game"
 SCREEN_SIZE = (128, 128)
+# Set by tools/create_exe.py to benchmark startup. The program quits after drawing
+# one frame and writes the time it was drawn (seconds since the epoch) to this path.
+FIRST_FRAME_ENV_VAR = "MY_GAME_FIRST_FRAME_FILE"
 
 
 def main():
@@ -24,9 +31,17 @@ def main():
     state_dict: dict[type[State], State] = {MainMenu: MainMenu(), Game: Game()}
     state_manager = StateManager(screen, state_dict, MainMenu, ORIGINAL_CAPTION)
 
+    # Queue a quit so the main loop runs exactly once.
+    first_frame_file = os.environ.get(FIRST_FRAME_ENV_VAR)
+    if first_frame_file:
+        pg.event.post(pg.Event(pg.QUIT))
+
     # Run main loop.
     state_manager.main()
 
+    if first_frame_file:
+        Path(first_frame_file).write_text(str(time.time()))
+
     pg.quit()
 
 
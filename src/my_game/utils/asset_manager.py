@@ -6,13 +6,15 @@ with various packaging methods.
 Each asset type (images, sounds, fonts, levels, UI elements) is represented by an Enum.
 Each Enum member has a method to load the asset.
 Enums were chosen to avoid hardcoding strings throughout the codebase.
+Each Enum's ROOT is the directory its values are relative to. tools/create_exe.py
+finds every Enum in this module and bundles only the files they reference.
 
 Usage:
     from my_game.utils.asset_manager import Images
     image = Images.ZOMBIE.load()  # Returns pygame surface.
 """
 
-from enum import Enum, unique
+from enum import Enum, nonmember, unique
 from functools import cache
 from importlib.resources import as_file, files
 from pathlib import Path
@@ -30,18 +32,21 @@ UI_PATH = ASSETS_PATH / "ui"
 
 @unique
 class Images(Enum):
+    ROOT = nonmember(IMAGES_PATH)
     MONSTER_FRAME_0 = "monster/frame_0.png"
     MONSTER_FRAME_1 = "monster/frame_1.png"
 
     @cache
     def load(self) -> pg.Surface:
-        with as_file(IMAGES_PATH / self.value) as path:
-            assert path.is_file(), f"Image file not found: {path}"
+        with as_file(self.ROOT / self.value) as path:
+            if not path.is_file():
+                raise FileNotFoundError(f"Image file not found: {path}")
             return pg.image.load(path).convert_alpha()
 
 
 @unique
 class Sounds(Enum):
+    ROOT = nonmember(SOUNDS_PATH)
     # Web builds with PygBag only support OGG sounds.
     EXPLOSION = "explosion.wav"
     SHOOT = "shoot.wav"
@@ -50,38 +55,44 @@ class Sounds(Enum):
     @cache
     def load(self) -> pg.Sound:
         # TODO: Music should probably be its own Enum that loads with pg.mixer.music.
-        with as_file(SOUNDS_PATH / self.value) as path:
-            assert path.is_file(), f"Sound file not found: {path}"
+        with as_file(self.ROOT / self.value) as path:
+            if not path.is_file():
+                raise FileNotFoundError(f"Sound file not found: {path}")
             return pg.Sound(path)
 
 
 @unique
 class Fonts(Enum):
+    ROOT = nonmember(FONTS_PATH)
     ARIAL = "arial.ttf"
     COMIC_SANS = "comic_sans.ttf"
 
     @cache
     def load(self) -> pg.Font:
-        with as_file(FONTS_PATH / self.value) as path:
-            assert path.is_file(), f"Font file not found: {path}"
+        with as_file(self.ROOT / self.value) as path:
+            if not path.is_file():
+                raise FileNotFoundError(f"Font file not found: {path}")
             # Default point size is 20; can be changed later.
             return pg.font.Font(path)
 
 
 @unique
 class Levels(Enum):
+    ROOT = nonmember(LEVELS_PATH)
     LEVEL_1 = "level_1.json"
     LEVEL_2 = "level_2.json"
 
     @cache
     def load(self) -> Path:
-        with as_file(LEVELS_PATH / self.value) as path:
-            assert path.is_file(), f"Level file not found: {path}"
+        with as_file(self.ROOT / self.value) as path:
+            if not path.is_file():
+                raise FileNotFoundError(f"Level file not found: {path}")
             return path
 
 
 @unique
 class UIElements(Enum):
+    ROOT = nonmember(UI_PATH)
     HEART_FULL = "healthbar/heart_full.png"
     HEART_EMPTY = "healthbar/heart_empty.png"
     NUMBER_0 = "numbers/0.png"
@@ -97,6 +108,7 @@ class UIElements(Enum):
 
     @cache
     def load(self) -> pg.Surface:
-        with as_file(UI_PATH / self.value) as path:
-            assert path.is_file(), f"Image file not found: {path}"
+        with as_file(self.ROOT / self.value) as path:
+            if not path.is_file():
+                raise FileNotFoundError(f"Image file not found: {path}")
             return pg.image.load(path).convert_alpha()
@@ -11,3 +11,50 @@ def test_main_exists():
     from my_game.main import main
 
     assert callable(main)
+
+
+def test_main_quits_after_first_frame(tmp_path, monkeypatch):
+    """Check main draws one frame and records when the benchmark variable is set."""
+    from my_game.main import FIRST_FRAME_ENV_VAR, main
+
+    first_frame_file = tmp_path / "first_frame"
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setenv(FIRST_FRAME_ENV_VAR, str(first_frame_file))
+
+    main()
+
+    float(first_frame_file.read_text())
+
+
+def test_stage_assets_copies_referenced_files(tmp_path, monkeypatch):
+    """Check only the assets referenced by the asset manager are staged for builds."""
+    import importlib.util
+    from pathlib import Path
+
+    from my_game.utils.asset_manager import ASSETS_PATH
+
+    project_root = Path(__file__).parents[1]
+    # create_exe reads pyproject.toml from the working directory on import.
+    monkeypatch.chdir(project_root)
+    spec = importlib.util.spec_from_file_location("create_exe", project_root / "tools" / "create_exe.py")
+    assert spec is not None and spec.loader is not None
+    create_exe = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(create_exe)
+
+    staged_path = tmp_path / "assets"
+    monkeypatch.setattr(create_exe, "STAGED_ASSETS_PATH", staged_path)
+    create_exe.stage_assets()
+
+    assets_root = Path(str(ASSETS_PATH))
+    expected = {
+        Path(str(root / member.value)).relative_to(assets_root)
+        for enum, root in create_exe.get_asset_enums().items()
+        for member in enum
+        if Path(str(root / member.value)).is_file()
+    }
+    staged = {path.relative_to(staged_path) for path in staged_path.rglob("*") if path.is_file()}
+    assert staged == expected
+    assert Path("images/monster/frame_0.png") in staged
+    assert Path("ui/numbers/9.png") in staged
+    # The icon is only used by PyInstaller, not loaded at runtime.
+    assert Path("icon.png") not in staged
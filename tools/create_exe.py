@@ -12,16 +12,39 @@ ICO and ICNS for Windows and Mac builds respectively.
 Mac apps built on ARM Macs may not run on Intel Macs. The reverse should be ok as ARM Macs
 can run x86_64 binaries via Rosetta2.
 
-Data files not loaded via the Asset Manager / Importlib may fail to be included or found
-unless configured correctly. This could be operating system or --onefile dependent.
+Only asset files referenced by the Asset Manager Enums are bundled. Every Enum in the Asset
+Manager must have a ROOT directory or the build fails. Data files not loaded via
+the Asset Manager / Importlib may fail to be included or found unless configured correctly.
+This could be operating system or --onefile dependent.
 Run the executable from the command line to see any error messages.
 
+Bytecode is compiled with optimisation level 2, which strips asserts and docstrings.
+Don't rely on either at runtime; raise exceptions instead of asserting.
+
+After building, the executable is launched under SDL's dummy video and audio drivers to
+measure the time until the first frame is drawn. The first launch and the median of the
+following launches are reported. The first launch is not a true cold start as it runs
+straight after the build, so the OS file cache is likely already warm.
+
+Usage:
+    uv run python tools/create_exe.py [--onefile] [--compress-assets] [--warm-runs N] [--no-benchmark]
+
 Pyinstaller Docs: https://pyinstaller.org/en/stable/usage.html
 """
 
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
 import sys
+import tempfile
+import time
 import tomllib
+from enum import Enum
 from importlib.resources import files
+from importlib.resources.abc import Traversable
+from pathlib import Path
 
 import PyInstaller.__main__ as pyinstaller  # type: ignore[import-untyped]
 
@@ -37,33 +60,141 @@ with open("pyproject.toml", "rb") as f:
 
 NAME = pyproject["project"]["name"]
 VERSION = pyproject["project"]["version"]
+APP_NAME = f"{NAME}-{VERSION}-{PLATFORM}"
 ICON = f"{files(NAME) / 'assets' / 'icon.png'}"
-DATAFILES: list[tuple[str, str]] = [
-    (f"{files(NAME)}/assets", f"{NAME}/assets"),
-]
+DIST_PATH = Path("dist")
+# Referenced assets are copied here before bundling.
+STAGED_ASSETS_PATH = Path("build") / f"{APP_NAME}-assets"
 HIDDEN_IMPORTS: list[str] = [
     # Add any hidden imports here.
 ]
-
-
-def build() -> None:
+EXCLUDED_MODULES: list[str] = [
+    # Pygame modules the game never imports. Remove an entry here if you start using it.
+    "pygame.examples",
+    "pygame.tests",
+    "pygame.docs",
+    "pygame.camera",
+    "pygame._camera_opencv",
+    "pygame.midi",
+    "pygame.pypm",
+    "pygame.freetype",
+    "pygame.ftfont",
+    "pygame.surfarray",
+    "pygame.sndarray",
+    # Only referenced by pygame so that packagers pick them up.
+    "numpy",
+    "OpenGL",
+]
+# Must match my_game.main.FIRST_FRAME_ENV_VAR. Not imported as that would open a window.
+FIRST_FRAME_ENV_VAR = "MY_GAME_FIRST_FRAME_FILE"
+BENCHMARK_TIMEOUT = 60  # Seconds to wait for the executable to draw its first frame.
+
+
+def get_asset_enums() -> dict[type[Enum], Traversable]:
+    """Return every asset Enum defined in the Asset Manager and its ROOT directory."""
+    # Imported here so pygame is only loaded when building.
+    from my_game.utils import asset_manager
+
+    asset_enums = [
+        obj
+        for obj in vars(asset_manager).values()
+        if isinstance(obj, type) and issubclass(obj, Enum) and obj.__module__ == asset_manager.__name__
+    ]
+    for enum in asset_enums:
+        if "ROOT" not in vars(enum):
+            raise SystemExit(f"ERROR: {enum.__name__} has no ROOT directory so its assets can't be bundled.")
+    return {enum: vars(enum)["ROOT"] for enum in asset_enums}
+
+
+def stage_assets(compress: bool = False) -> None:
+    """Copy the asset files referenced by the Asset Manager Enums to STAGED_ASSETS_PATH.
+
+    compress: Losslessly recompress PNG files with Pillow, keeping whichever file is smaller.
+    """
+    from my_game.utils.asset_manager import ASSETS_PATH
+
+    shutil.rmtree(STAGED_ASSETS_PATH, ignore_errors=True)
+    assets_root = Path(str(ASSETS_PATH))
+    original_size = staged_size = 0
+
+    for enum, root in get_asset_enums().items():
+        for member in enum:
+            src = Path(str(root / member.value))
+            if not src.is_file():
+                print(f"WARNING: {enum.__name__}.{member.name} not found, skipping: {src}")
+                continue
+            dst = STAGED_ASSETS_PATH / src.relative_to(assets_root)
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(src, dst)
+            if compress and src.suffix.lower() == ".png":
+                compress_png(src, dst)
+            original_size += src.stat().st_size
+            staged_size += dst.stat().st_size
+
+    print(f"Staged assets: {original_size / 1024:.1f} KiB -> {staged_size / 1024:.1f} KiB")
+
+
+def compress_png(src: Path, dst: Path) -> None:
+    """Overwrite dst with a losslessly optimised copy of src if it is smaller."""
+    from PIL import Image
+
+    with tempfile.TemporaryDirectory() as tmp:
+        optimised = Path(tmp) / src.name
+        with Image.open(src) as image:
+            image.save(optimised, optimize=True)
+        if optimised.stat().st_size < dst.stat().st_size:
+            shutil.copyfile(optimised, dst)
+
+
+def find_executable(onefile: bool) -> Path:
+    """Return the path of the executable PyInstaller created."""
+    if PLATFORM == "mac":
+        return DIST_PATH / f"{APP_NAME}.app" / "Contents" / "MacOS" / APP_NAME
+    suffix = ".exe" if PLATFORM == "win" else ""
+    if onefile:
+        return DIST_PATH / f"{APP_NAME}{suffix}"
+    return DIST_PATH / APP_NAME / f"{APP_NAME}{suffix}"
+
+
+def find_artifact(onefile: bool) -> Path:
+    """Return the file or directory that gets shipped."""
+    if PLATFORM == "mac":
+        return DIST_PATH / f"{APP_NAME}.app"
+    if onefile:
+        return find_executable(onefile)
+    return DIST_PATH / APP_NAME
+
+
+def get_size(path: Path) -> int:
+    """Return the size in bytes of a file or directory."""
+    if path.is_file():
+        return path.stat().st_size
+    return sum(file.stat().st_size for file in path.rglob("*") if file.is_file())
+
+
+def build(onefile: bool = False, compress_assets: bool = False) -> None:
     """Build the executable"""
 
-    add_data = [arg for src, dst in DATAFILES for arg in ("--add-data", f"{src}:{dst}")]
+    stage_assets(compress_assets)
+    add_data = ("--add-data", f"{STAGED_ASSETS_PATH}:{NAME}/assets")
     hidden_imports = [arg for item in HIDDEN_IMPORTS for arg in ("--hidden-import", item)]
+    excluded_modules = [arg for item in EXCLUDED_MODULES for arg in ("--exclude-module", item)]
 
     pyinstaller.run(
         [
             str(files(NAME) / "main.py"),
             # '--clean',
-            *("-n", f"{NAME}-{VERSION}-{PLATFORM}"),
+            *("-n", APP_NAME),
             # Onefile mode is not recommended due to long load times and antivirus issues.
             # Especially on MacOS where an app bundle is preferred.
-            # '--onefile',
+            *(["--onefile"] if onefile else []),
             "--windowed",
             "--noconfirm",
             *("--log-level", "WARN"),
+            # Equivalent to python -OO.
+            *("--optimize", "2"),
             *hidden_imports,
+            *excluded_modules,
             *add_data,
             "-i",
             ICON,
@@ -71,5 +202,45 @@ def build() -> None:
     )
 
 
+def time_to_first_frame(executable: Path) -> float:
+    """Launch the executable headless and return the seconds until its first frame was drawn."""
+    with tempfile.TemporaryDirectory() as tmp:
+        first_frame_file = Path(tmp) / "first_frame"
+        env = {
+            **os.environ,
+            "SDL_VIDEODRIVER": "dummy",
+            "SDL_AUDIODRIVER": "dummy",
+            FIRST_FRAME_ENV_VAR: str(first_frame_file),
+        }
+        # Wall clock time as it is comparable between processes.
+        start = time.time()
+        subprocess.run([executable], env=env, check=True, timeout=BENCHMARK_TIMEOUT)
+        return float(first_frame_file.read_text()) - start
+
+
+def benchmark(onefile: bool, warm_runs: int) -> None:
+    """Report the size and startup times of the built executable."""
+    executable = find_executable(onefile)
+    artifact = find_artifact(onefile)
+
+    first_launch = time_to_first_frame(executable)
+    warm_starts = [time_to_first_frame(executable) for _ in range(warm_runs)]
+
+    print(f"Build report for {artifact}")
+    print(f"  Size:         {get_size(artifact) / 1024**2:.2f} MiB")
+    print(f"  First launch: {first_launch:.3f} s")
+    if warm_starts:
+        print(f"  Warm start:   {statistics.median(warm_starts):.3f} s (median of {len(warm_starts)})")
+
+
 if __name__ == "__main__":
-    build()
+    parser = argparse.ArgumentParser(description="Build an executable for the current platform.")
+    parser.add_argument("--onefile", action="store_true", help="Bundle everything into a single executable.")
+    parser.add_argument("--compress-assets", action="store_true", help="Losslessly recompress PNG assets.")
+    parser.add_argument("--warm-runs", type=int, default=5, help="Launches used to measure the warm start time.")
+    parser.add_argument("--no-benchmark", action="store_true", help="Skip measuring startup time.")
+    args = parser.parse_args()
+
+    build(args.onefile, args.compress_assets)
+    if not args.no_benchmark:
+        benchmark(args.onefile, args.warm_runs)